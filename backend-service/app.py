@@ -1,11 +1,16 @@
 import os
 import random
+import re
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import jwt
 from flask import Flask, jsonify, request
-from pymongo import MongoClient, ReturnDocument
+from pymongo import ASCENDING, DESCENDING, TEXT, MongoClient, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
 app = Flask(__name__)
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-me")
@@ -19,6 +24,7 @@ if mongo_db is None:
 users_col = mongo_db["users"]
 reservations_col = mongo_db["reservations"]
 counters_col = mongo_db["counters"]
+booking_queue_col = mongo_db["booking_queue"]
 
 ADMIN_USERS = [
     {"name": "Yama Admin", "email": "yama@admin", "password": "akuyama", "role": "admin"},
@@ -42,6 +48,32 @@ TIME_SLOTS = [
 RATE_PER_HOUR = 50000
 EXTRA_PER_PERSON = 25000
 INCLUDED_PLAYERS = 2
+MAX_PLAYERS_PER_LANE = 6
+
+SUGGESTION_DEFAULT_LIMIT = 3
+SUGGESTION_MAX_LIMIT = 10
+
+SEARCH_DEFAULT_PER_PAGE = 20
+SEARCH_MAX_PER_PAGE = 100
+SEARCH_FIELDS = ("name_lower", "phone_normalized")
+SEARCH_COUNT_LIMIT = 10000
+SEARCH_BACKFILL_BATCH = 1000
+PHONE_QUERY_RE = re.compile(r"^[\d\s+\-]+$")
+
+BOOKING_BATCH_SIZE = int(os.getenv("BOOKING_BATCH_SIZE", "50"))
+BOOKING_WAIT_MAX_SECONDS = 30
+BOOKING_MAX_RETRIES = 5
+BOOKING_RETRY_BASE_SECONDS = 0.5
+BOOKING_RETRY_MAX_SECONDS = 10
+BOOKING_SWEEP_SECONDS = int(os.getenv("BOOKING_SWEEP_SECONDS", "30"))
+BOOKING_TICKET_TTL_SECONDS = int(os.getenv("BOOKING_TICKET_TTL_SECONDS", str(7 * 24 * 3600)))
+DUPLICATE_KEY_ERROR = 11000
+
+booking_workers_lock = threading.Lock()
+booking_workers: Dict[str, threading.Event] = {}
+booking_queue_cond = threading.Condition()
+date_locks_guard = threading.Lock()
+date_locks: Dict[str, threading.Lock] = {}
 
 
 def ensure_indexes():
@@ -49,6 +81,57 @@ def ensure_indexes():
     reservations_col.create_index("date")
     reservations_col.create_index("lane")
     reservations_col.create_index("customer_email")
+    reservations_col.create_index([("date", ASCENDING), ("start_time", ASCENDING), ("lane", ASCENDING)])
+    reservations_col.create_index([("name_lower", ASCENDING), ("date", ASCENDING)])
+    reservations_col.create_index([("phone_normalized", ASCENDING), ("date", ASCENDING)])
+    reservations_col.create_index([("notes", TEXT)], default_language="none")
+    reservations_col.create_index("ticket_id", unique=True, sparse=True)
+    booking_queue_col.create_index("ticket_id", unique=True)
+    booking_queue_col.create_index([("status", ASCENDING), ("date", ASCENDING), ("_id", ASCENDING)])
+    ensure_ticket_ttl_index()
+
+
+def ensure_ticket_ttl_index():
+    ttl_index = booking_queue_col.index_information().get("processed_at_1")
+    if ttl_index is None:
+        booking_queue_col.create_index("processed_at", expireAfterSeconds=BOOKING_TICKET_TTL_SECONDS)
+    elif ttl_index.get("expireAfterSeconds") != BOOKING_TICKET_TTL_SECONDS:
+        # create_index refuses to change the TTL of an existing index; collMod updates it in place.
+        mongo_db.command(
+            "collMod",
+            booking_queue_col.name,
+            index={"keyPattern": {"processed_at": 1}, "expireAfterSeconds": BOOKING_TICKET_TTL_SECONDS},
+        )
+
+
+def normalize_phone(phone: str) -> str:
+    return re.sub(r"\D", "", phone or "")
+
+
+def search_fields(name: str, phone: str) -> Dict:
+    return {
+        "name_lower": (name or "").strip().lower(),
+        "phone_normalized": normalize_phone(phone),
+    }
+
+
+def is_phone_query(term: str) -> bool:
+    return bool(PHONE_QUERY_RE.match(term)) and len(normalize_phone(term)) >= 3
+
+
+def backfill_search_fields():
+    cursor = reservations_col.find(
+        {"$or": [{field: {"$exists": False}} for field in SEARCH_FIELDS]},
+        {"name": 1, "phone": 1},
+    )
+    updates: List[UpdateOne] = []
+    for r in cursor:
+        updates.append(UpdateOne({"_id": r["_id"]}, {"$set": search_fields(r.get("name"), r.get("phone"))}))
+        if len(updates) >= SEARCH_BACKFILL_BATCH:
+            reservations_col.bulk_write(updates, ordered=False)
+            updates = []
+    if updates:
+        reservations_col.bulk_write(updates, ordered=False)
 
 
 def ensure_admin_users():
@@ -66,10 +149,10 @@ def ensure_admin_users():
         )
 
 
-def get_next_sequence(name: str) -> int:
+def get_next_sequence(name: str, step: int = 1) -> int:
     doc = counters_col.find_one_and_update(
         {"_id": name},
-        {"$inc": {"value": 1}},
+        {"$inc": {"value": step}},
         upsert=True,
         return_document=ReturnDocument.AFTER,
     )
@@ -145,8 +228,134 @@ def has_conflict(date: str, start_time: str, duration_hours: int, lane: str, exc
     return False
 
 
+def build_lane_occupancy(reservations: List[Dict]) -> Dict[str, set]:
+    occupancy: Dict[str, set] = {lane: set() for lane in LANES}
+    for r in reservations:
+        occupy_slot(occupancy, r["lane"], r["start_time"], r["duration_hours"])
+    return occupancy
+
+
+def load_lane_occupancy(date: str) -> Dict[str, set]:
+    return build_lane_occupancy(
+        list(reservations_col.find({"date": date}, {"_id": 0, "lane": 1, "start_time": 1, "duration_hours": 1}))
+    )
+
+
+def occupy_slot(occupancy: Dict[str, set], lane: str, start_time: str, duration_hours: int):
+    start_hour = time_to_minutes(start_time) // 60
+    occupancy.setdefault(lane, set()).update(range(start_hour, start_hour + duration_hours))
+
+
+def is_slot_free(occupancy: Dict[str, set], lane: str, start_time: str, duration_hours: int) -> bool:
+    start_hour = time_to_minutes(start_time) // 60
+    return occupancy.get(lane, set()).isdisjoint(range(start_hour, start_hour + duration_hours))
+
+
+def suggest_alternatives(
+    occupancy: Dict[str, set],
+    start_time: str,
+    duration_hours: int,
+    lane: str,
+    lanes_needed: int = 1,
+    limit: int = SUGGESTION_DEFAULT_LIMIT,
+) -> Dict:
+    lane_index = LANES.index(lane)
+    start_hour = time_to_minutes(start_time) // 60
+    free_now = [is_slot_free(occupancy, candidate, start_time, duration_hours) for candidate in LANES]
+
+    same_time = sorted(
+        (i for i, free in enumerate(free_now) if free and i != lane_index),
+        key=lambda i: abs(i - lane_index),
+    )
+    same_lane = sorted(
+        (slot for slot in TIME_SLOTS if slot != start_time and is_slot_free(occupancy, lane, slot, duration_hours)),
+        key=lambda slot: (abs(time_to_minutes(slot) // 60 - start_hour), slot),
+    )
+    groups = []
+    if lanes_needed > 1:
+        groups = sorted(
+            (i for i in range(len(LANES) - lanes_needed + 1) if all(free_now[i : i + lanes_needed])),
+            key=lambda i: (min(abs(j - lane_index) for j in range(i, i + lanes_needed)), i),
+        )
+
+    end_time = add_hours(start_time, duration_hours)
+    return {
+        "same_time": [
+            {"lane": LANES[i], "start_time": start_time, "end_time": end_time} for i in same_time[:limit]
+        ],
+        "same_lane": [
+            {"lane": lane, "start_time": slot, "end_time": add_hours(slot, duration_hours)} for slot in same_lane[:limit]
+        ],
+        "adjacent_lanes": [
+            {"lanes": LANES[i : i + lanes_needed], "start_time": start_time, "end_time": end_time}
+            for i in groups[:limit]
+        ],
+    }
+
+
+def lanes_for_players(players: int) -> int:
+    return max(-(-players // MAX_PLAYERS_PER_LANE), 1)
+
+
+def validate_slot(date: str, start_time: str, duration_hours: int, lane: str) -> Optional[str]:
+    if lane not in LANES:
+        return "Lane tidak valid."
+    if start_time not in TIME_SLOTS:
+        return "Slot waktu tidak valid."
+    if duration_hours not in {1, 2, 3}:
+        return "Durasi hanya boleh 1-3 jam."
+    try:
+        parse_date(date)
+    except ValueError:
+        return "Format tanggal harus YYYY-MM-DD."
+    return None
+
+
+def build_reservation(data: Dict, auth: Dict) -> Tuple[Optional[Dict], Optional[str]]:
+    name = (data.get("name") or "").strip()
+    phone = (data.get("phone") or "").strip()
+    date = (data.get("date") or "").strip()
+    start_time = (data.get("time") or data.get("start_time") or "").strip()
+    duration_hours = int(data.get("duration_hours") or 0)
+    lane = (data.get("lane") or "").strip()
+    players = int(data.get("players") or 0)
+    notes = (data.get("notes") or "").strip()
+
+    customer_email = data.get("customer_email", "").strip().lower() or None
+    if auth.get("role") == "customer":
+        name = auth.get("name")
+        customer_email = auth.get("email")
+
+    if not all([name, phone, date, start_time, lane]) or players <= 0 or duration_hours <= 0:
+        return None, "Nama, kontak, tanggal, jam, durasi, lane, dan jumlah pemain wajib diisi."
+
+    error = validate_slot(date, start_time, duration_hours, lane)
+    if error:
+        return None, error
+
+    extra_players = max(players - INCLUDED_PLAYERS, 0)
+    total_cost = RATE_PER_HOUR * duration_hours + EXTRA_PER_PERSON * extra_players
+
+    return {
+        "name": name,
+        "phone": phone,
+        "date": date,
+        "start_time": start_time,
+        "end_time": add_hours(start_time, duration_hours),
+        "duration_hours": duration_hours,
+        "lane": lane,
+        "players": players,
+        "notes": notes,
+        "total_cost": total_cost,
+        "customer_email": customer_email,
+        **search_fields(name, phone),
+    }, None
+
+
 def serialize_reservation(reservation: Dict) -> Dict:
     reservation.pop("_id", None)
+    for field in SEARCH_FIELDS:
+        reservation.pop(field, None)
     return reservation
 
 
@@ -155,6 +364,215 @@ def fetch_reservations(query: Dict) -> List[Dict]:
     return [serialize_reservation(r) for r in cursor]
 
 
+def search_reservations(term: str, query: Dict, page: int, per_page: int) -> Dict:
+    match = dict(query)
+    skip = (page - 1) * per_page
+    if not term:
+        cursor = (
+            reservations_col.find(match)
+            .sort([("date", ASCENDING), ("start_time", ASCENDING), ("lane", ASCENDING)])
+            .skip(skip)
+            .limit(per_page)
+        )
+        items = list(cursor)
+    else:
+        lowered = term.lower()
+        prefix = f"^{re.escape(lowered)}"
+        clauses: List[Dict] = [
+            {"name_lower": {"$regex": prefix}},
+            {"customer_email": {"$regex": prefix}},
+            {"$text": {"$search": term}},
+        ]
+        relevance: List[Dict] = [
+            {"$cond": [{"$eq": ["$name_lower", lowered]}, 8, 0]},
+            {"$cond": [{"$regexMatch": {"input": "$name_lower", "regex": prefix}}, 4, 0]},
+            {"$cond": [{"$regexMatch": {"input": {"$ifNull": ["$customer_email", ""]}, "regex": prefix}}, 3, 0]},
+            {"$ifNull": [{"$meta": "textScore"}, 0]},
+        ]
+        if is_phone_query(term):
+            digits = normalize_phone(term)
+            clauses.append({"phone_normalized": {"$regex": f"^{digits}"}})
+            relevance.append({"$cond": [{"$regexMatch": {"input": "$phone_normalized", "regex": f"^{digits}"}}, 4, 0]})
+        match["$or"] = clauses
+
+        # $sort directly followed by $skip/$limit lets MongoDB keep only the top-k documents.
+        pipeline: List[Dict] = [
+            {"$match": match},
+            {"$addFields": {"relevance": {"$add": relevance}}},
+            {"$sort": {"relevance": DESCENDING, "date": ASCENDING, "start_time": ASCENDING, "lane": ASCENDING}},
+            {"$skip": skip},
+            {"$limit": per_page},
+        ]
+        items = list(reservations_col.aggregate(pipeline))
+
+    total = reservations_col.count_documents(match, limit=SEARCH_COUNT_LIMIT)
+    return {
+        "total": total,
+        "total_capped": total >= SEARCH_COUNT_LIMIT,
+        "page": page,
+        "per_page": per_page,
+        "items": [serialize_reservation(r) for r in items],
+    }
+
+
+def date_write_lock(date: str) -> threading.Lock:
+    with date_locks_guard:
+        return date_locks.setdefault(date, threading.Lock())
+
+
+def serialize_ticket(ticket: Dict) -> Dict:
+    ticket.pop("_id", None)
+    if isinstance(ticket.get("processed_at"), datetime):
+        ticket["processed_at"] = ticket["processed_at"].replace(tzinfo=timezone.utc).isoformat()
+    if ticket.get("reservation"):
+        serialize_reservation(ticket["reservation"])
+    return ticket
+
+
+def commit_booking_tickets(date: str, tickets: List[Dict]) -> Dict[str, Dict]:
+    existing = list(reservations_col.find({"date": date}, {"_id": 0}))
+    occupancy = build_lane_occupancy(existing)
+    committed = {r["ticket_id"]: r for r in existing if r.get("ticket_id")}
+
+    # Tickets whose reservation was inserted before a crash are only marked done.
+    outcomes: Dict[str, Dict] = {}
+    accepted: List[Tuple[str, Dict]] = []
+    for ticket in tickets:
+        ticket_id = ticket["ticket_id"]
+        if ticket_id in committed:
+            outcomes[ticket_id] = {"status": "accepted", "reservation": serialize_reservation(committed[ticket_id])}
+            continue
+        draft = ticket["reservation"]
+        if not is_slot_free(occupancy, draft["lane"], draft["start_time"], draft["duration_hours"]):
+            outcomes[ticket_id] = {
+                "status": "rejected",
+                "message": "Slot sudah dipesan. Pilih jam atau lane lain.",
+                "suggestions": suggest_alternatives(
+                    occupancy,
+                    draft["start_time"],
+                    draft["duration_hours"],
+                    draft["lane"],
+                    lanes_for_players(draft["players"]),
+                ),
+            }
+            continue
+        occupy_slot(occupancy, draft["lane"], draft["start_time"], draft["duration_hours"])
+        accepted.append((ticket_id, draft))
+
+    if accepted:
+        last_id = get_next_sequence("reservation_id", len(accepted))
+        created_at = datetime.now(timezone.utc).isoformat()
+        new_reservations = [
+            {"id": last_id - len(accepted) + 1 + offset, **draft, "created_at": created_at, "ticket_id": ticket_id}
+            for offset, (ticket_id, draft) in enumerate(accepted)
+        ]
+        duplicates: set = set()
+        try:
+            reservations_col.insert_many(new_reservations, ordered=False)
+        except BulkWriteError as exc:
+            # Another writer already committed these tickets; the unique ticket_id index kept them single.
+            errors = exc.details.get("writeErrors", [])
+            if any(e.get("code") != DUPLICATE_KEY_ERROR for e in errors):
+                raise
+            duplicates = {new_reservations[e["index"]]["ticket_id"] for e in errors}
+        for reservation in new_reservations:
+            if reservation["ticket_id"] in duplicates:
+                continue
+            outcomes[reservation["ticket_id"]] = {
+                "status": "accepted",
+                "reservation": serialize_reservation(dict(reservation)),
+            }
+        for reservation in reservations_col.find({"ticket_id": {"$in": list(duplicates)}}, {"_id": 0}):
+            outcomes[reservation["ticket_id"]] = {"status": "accepted", "reservation": serialize_reservation(reservation)}
+    return outcomes
+
+
+def process_booking_batch(date: str) -> int:
+    tickets = list(
+        booking_queue_col.find({"date": date, "status": "pending"}).sort("_id", ASCENDING).limit(BOOKING_BATCH_SIZE)
+    )
+    if not tickets:
+        return 0
+
+    # Direct bookings for the same date wait on this lock, so the occupancy read here stays current.
+    with date_write_lock(date):
+        outcomes = commit_booking_tickets(date, tickets)
+
+    processed_at = datetime.now(timezone.utc)
+    booking_queue_col.bulk_write(
+        [
+            UpdateOne({"ticket_id": ticket_id}, {"$set": {**outcome, "processed_at": processed_at}})
+            for ticket_id, outcome in outcomes.items()
+        ],
+        ordered=False,
+    )
+    with booking_queue_cond:
+        booking_queue_cond.notify_all()
+    return len(tickets)
+
+
+def run_booking_worker(date: str, wake: threading.Event):
+    failures = 0
+    while True:
+        wake.clear()
+        try:
+            processed = process_booking_batch(date)
+            failures = 0
+        except Exception:
+            failures += 1
+            if failures <= BOOKING_MAX_RETRIES:
+                app.logger.exception("Booking worker for %s failed (attempt %d); retrying", date, failures)
+                time.sleep(min(BOOKING_RETRY_BASE_SECONDS * 2 ** (failures - 1), BOOKING_RETRY_MAX_SECONDS))
+                continue
+            app.logger.exception("Booking worker for %s failed; pending tickets wait for the next sweep", date)
+            failures = 0
+            processed = 0
+        if processed:
+            continue
+        with booking_workers_lock:
+            if wake.is_set():
+                continue
+            booking_workers.pop(date, None)
+            return
+
+
+def schedule_booking_worker(date: str):
+    with booking_workers_lock:
+        wake = booking_workers.get(date)
+        if wake is not None:
+            wake.set()
+            return
+        wake = threading.Event()
+        booking_workers[date] = wake
+    threading.Thread(target=run_booking_worker, args=(date, wake), daemon=True).start()
+
+
+def wait_for_ticket(ticket_id: str, timeout: float) -> Optional[Dict]:
+    deadline = time.monotonic() + timeout
+    while True:
+        ticket = booking_queue_col.find_one({"ticket_id": ticket_id})
+        remaining = deadline - time.monotonic()
+        if ticket is None or ticket["status"] != "pending" or remaining <= 0:
+            return ticket
+        # Re-check at least every second in case the notify came from another process.
+        with booking_queue_cond:
+            booking_queue_cond.wait(min(remaining, 1.0))
+
+
+def resume_booking_queue():
+    for date in booking_queue_col.distinct("date", {"status": "pending"}):
+        schedule_booking_worker(date)
+
+
+def run_booking_sweeper():
+    while True:
+        time.sleep(BOOKING_SWEEP_SECONDS)
+        try:
+            resume_booking_queue()
+        except Exception:
+            app.logger.exception("Booking queue sweep failed")
+
+
 def seed_dummy_reservations():
     if reservations_col.count_documents({}) > 0:
         return
@@ -206,11 +624,12 @@ def seed_dummy_reservations():
         extra_players = max(players - INCLUDED_PLAYERS, 0)
         total_cost = RATE_PER_HOUR * duration_hours + EXTRA_PER_PERSON * extra_players
 
+        name = rng.choice(names)
         phone = f"08{rng.randint(1111, 9999)}{rng.randint(1111, 9999)}"
         reservations.append(
             {
                 "id": get_next_sequence("reservation_id"),
-                "name": rng.choice(names),
+                "name": name,
                 "phone": phone,
                 "date": base_date,
                 "start_time": start_time,
@@ -222,6 +641,7 @@ def seed_dummy_reservations():
                 "total_cost": total_cost,
                 "customer_email": rng.choice(email_pool),
                 "created_at": datetime.now(timezone.utc).isoformat(),
+                **search_fields(name, phone),
             }
         )
 
@@ -231,8 +651,11 @@ def seed_dummy_reservations():
 
 def initialize_storage():
     ensure_indexes()
+    backfill_search_fields()
     ensure_admin_users()
     seed_dummy_reservations()
+    resume_booking_queue()
+    threading.Thread(target=run_booking_sweeper, daemon=True).start()
 
 
 initialize_storage()
@@ -300,70 +723,128 @@ def list_reservations():
     return jsonify(fetch_reservations(query))
 
 
-@app.route("/api/reservations", methods=["POST"])
-def create_reservation():
+@app.route("/api/reservations/search", methods=["GET"])
+def search_reservations_endpoint():
     auth = require_auth()
     if not auth:
         return jsonify({"status": "error", "message": "Unauthorized"}), 401
+    if not is_admin(auth):
+        return jsonify({"status": "error", "message": "Forbidden"}), 403
 
-    role = auth.get("role")
-    auth_name = auth.get("name")
-    auth_email = auth.get("email")
+    term = (request.args.get("q") or "").strip()
+    date_from = (request.args.get("date_from") or "").strip()
+    date_to = (request.args.get("date_to") or "").strip()
+    lane = (request.args.get("lane") or "").strip()
 
-    data = request.get_json(silent=True) or {}
-    name = (data.get("name") or "").strip()
-    phone = (data.get("phone") or "").strip()
-    date = (data.get("date") or "").strip()
-    start_time = (data.get("time") or data.get("start_time") or "").strip()
-    duration_hours = int(data.get("duration_hours") or 0)
-    lane = (data.get("lane") or "").strip()
-    players = int(data.get("players") or 0)
-    notes = (data.get("notes") or "").strip()
-
-    customer_email = data.get("customer_email", "").strip().lower() or None
-    if role == "customer":
-        name = auth_name
-        customer_email = auth_email
+    query: Dict = {}
+    try:
+        if date_from:
+            parse_date(date_from)
+            query.setdefault("date", {})["$gte"] = date_from
+        if date_to:
+            parse_date(date_to)
+            query.setdefault("date", {})["$lte"] = date_to
+    except ValueError:
+        return jsonify({"status": "error", "message": "Format tanggal harus YYYY-MM-DD"}), 400
 
-    if not all([name, phone, date, start_time, lane]) or players <= 0 or duration_hours <= 0:
-        return jsonify({"status": "error", "message": "Nama, kontak, tanggal, jam, durasi, lane, dan jumlah pemain wajib diisi."}), 400
+    if lane:
+        if lane not in LANES:
+            return jsonify({"status": "error", "message": "Lane tidak valid."}), 400
+        query["lane"] = lane
 
-    if lane not in LANES:
-        return jsonify({"status": "error", "message": "Lane tidak valid."}), 400
-    if start_time not in TIME_SLOTS:
-        return jsonify({"status": "error", "message": "Slot waktu tidak valid."}), 400
-    if duration_hours not in {1, 2, 3}:
-        return jsonify({"status": "error", "message": "Durasi hanya boleh 1-3 jam."}), 400
     try:
-        parse_date(date)
+        page = max(int(request.args.get("page") or 1), 1)
+        per_page = int(request.args.get("per_page") or SEARCH_DEFAULT_PER_PAGE)
     except ValueError:
-        return jsonify({"status": "error", "message": "Format tanggal harus YYYY-MM-DD."}), 400
+        return jsonify({"status": "error", "message": "Parameter page/per_page harus angka."}), 400
+    per_page = min(max(per_page, 1), SEARCH_MAX_PER_PAGE)
 
-    end_time = add_hours(start_time, duration_hours)
+    return jsonify(search_reservations(term, query, page, per_page))
 
-    if has_conflict(date, start_time, duration_hours, lane):
-        return jsonify({"status": "error", "message": "Slot sudah dipesan. Pilih jam atau lane lain."}), 409
 
-    extra_players = max(players - INCLUDED_PLAYERS, 0)
-    total_cost = RATE_PER_HOUR * duration_hours + EXTRA_PER_PERSON * extra_players
+@app.route("/api/reservations", methods=["POST"])
+def create_reservation():
+    auth = require_auth()
+    if not auth:
+        return jsonify({"status": "error", "message": "Unauthorized"}), 401
 
-    new_res = {
-        "id": get_next_sequence("reservation_id"),
-        "name": name,
-        "phone": phone,
-        "date": date,
-        "start_time": start_time,
-        "end_time": end_time,
-        "duration_hours": duration_hours,
-        "lane": lane,
-        "players": players,
-        "notes": notes,
-        "total_cost": total_cost,
-        "customer_email": customer_email,
+    draft, error = build_reservation(request.get_json(silent=True) or {}, auth)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    with date_write_lock(draft["date"]):
+        occupancy = load_lane_occupancy(draft["date"])
+        if not is_slot_free(occupancy, draft["lane"], draft["start_time"], draft["duration_hours"]):
+            suggestions = suggest_alternatives(
+                occupancy,
+                draft["start_time"],
+                draft["duration_hours"],
+                draft["lane"],
+                lanes_for_players(draft["players"]),
+            )
+            return jsonify(
+                {
+                    "status": "error",
+                    "message": "Slot sudah dipesan. Pilih jam atau lane lain.",
+                    "suggestions": suggestions,
+                }
+            ), 409
+
+        new_res = {
+            "id": get_next_sequence("reservation_id"),
+            **draft,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        reservations_col.insert_one(new_res)
+    return jsonify({"status": "success", "reservation": serialize_reservation(new_res)})
+
+
+@app.route("/api/reservations/queue", methods=["POST"])
+def enqueue_reservation():
+    auth = require_auth()
+    if not auth:
+        return jsonify({"status": "error", "message": "Unauthorized"}), 401
+
+    draft, error = build_reservation(request.get_json(silent=True) or {}, auth)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    ticket = {
+        "ticket_id": uuid.uuid4().hex,
+        "date": draft["date"],
+        "status": "pending",
+        "reservation": draft,
+        "requested_by": auth.get("email"),
+        "message": None,
         "created_at": datetime.now(timezone.utc).isoformat(),
+        "processed_at": None,
     }
-    reservations_col.insert_one(new_res)
-    return jsonify({"status": "success", "reservation": new_res})
+    booking_queue_col.insert_one(ticket)
+    schedule_booking_worker(draft["date"])
+    return jsonify({"status": "success", "ticket": serialize_ticket(ticket)}), 202
+
+
+@app.route("/api/reservations/queue/<ticket_id>", methods=["GET"])
+def get_booking_ticket(ticket_id: str):
+    auth = require_auth()
+    if not auth:
+        return jsonify({"status": "error", "message": "Unauthorized"}), 401
+
+    try:
+        wait = min(max(float(request.args.get("wait") or 0), 0), BOOKING_WAIT_MAX_SECONDS)
+    except ValueError:
+        return jsonify({"status": "error", "message": "Parameter wait harus angka."}), 400
+
+    ticket = booking_queue_col.find_one({"ticket_id": ticket_id}, {"_id": 0, "requested_by": 1})
+    if not ticket:
+        return jsonify({"status": "error", "message": "Tiket tidak ditemukan."}), 404
+    if not is_admin(auth) and ticket.get("requested_by") != auth.get("email"):
+        return jsonify({"status": "error", "message": "Forbidden"}), 403
+
+    ticket = wait_for_ticket(ticket_id, wait)
+    if not ticket:
+        return jsonify({"status": "error", "message": "Tiket tidak ditemukan."}), 404
+    return jsonify({"status": "success", "ticket": serialize_ticket(ticket)})
 
 
 @app.route("/api/reservations/<int:res_id>", methods=["DELETE"])
@@ -386,6 +867,38 @@ def delete_reservation(res_id: int):
     return jsonify({"status": "success"})
 
 
+@app.route("/api/suggest", methods=["GET"])
+def suggest():
+    date = (request.args.get("date") or "").strip()
+    start_time = (request.args.get("time") or request.args.get("start_time") or "").strip()
+    lane = (request.args.get("lane") or "").strip()
+    try:
+        duration_hours = int(request.args.get("duration_hours") or 1)
+        players = int(request.args.get("players") or 0)
+        lanes_needed = int(request.args.get("lanes") or 0)
+        limit = int(request.args.get("limit") or SUGGESTION_DEFAULT_LIMIT)
+    except ValueError:
+        return jsonify({"status": "error", "message": "Parameter durasi, pemain, lanes, dan limit harus angka."}), 400
+
+    if not all([date, start_time, lane]):
+        return jsonify({"status": "error", "message": "Tanggal, jam, dan lane wajib diisi."}), 400
+    error = validate_slot(date, start_time, duration_hours, lane)
+    if error:
+        return jsonify({"status": "error", "message": error}), 400
+
+    lanes_needed = min(max(lanes_needed, lanes_for_players(players)), len(LANES))
+    limit = min(max(limit, 1), SUGGESTION_MAX_LIMIT)
+
+    occupancy = load_lane_occupancy(date)
+    return jsonify(
+        {
+            "status": "success",
+            "available": is_slot_free(occupancy, lane, start_time, duration_hours),
+            "suggestions": suggest_alternatives(occupancy, start_time, duration_hours, lane, lanes_needed, limit),
+        }
+    )
+
+
 @app.route("/api/meta", methods=["GET"])
 def meta():
     return jsonify(
@@ -18,6 +18,18 @@ def token() -> Optional[str]:
     return session.get("token")
 
 
+def describe_suggestions(suggestions: Dict[str, Any]) -> str:
+    options = [
+        f"{s['lane']} {s['start_time']}-{s['end_time']}"
+        for s in suggestions.get("same_time", []) + suggestions.get("same_lane", [])
+    ]
+    options += [
+        f"{' + '.join(g['lanes'])} {g['start_time']}-{g['end_time']}"
+        for g in suggestions.get("adjacent_lanes", [])
+    ]
+    return f" Alternatif: {', '.join(options)}." if options else ""
+
+
 @app.route("/login", methods=["GET", "POST"])
 def login():
     error = None
@@ -118,7 +130,9 @@ def dashboard():
                 if resp.ok:
                     session["flash_message"] = "Reservasi berhasil disimpan."
                 else:
-                    session["flash_error"] = data.get("message", "Gagal menyimpan reservasi.")
+                    session["flash_error"] = data.get("message", "Gagal menyimpan reservasi.") + describe_suggestions(
+                        data.get("suggestions") or {}
+                    )
             except requests.RequestException:
                 session["flash_error"] = "Tidak dapat terhubung ke backend."
             return redirect(url_for("dashboard"))